@@ -13,17 +13,99 @@ Agents can later add:
 
 from __future__ import annotations
 import argparse
+import mmap
+import os
+import stat
 import sys
-from typing import Iterable
+from itertools import chain, islice
+from typing import Iterable, Iterator
 
 from .normalize import normalize_lines
 from .rules import Rule
 
 
+# Large read buffer so bulk input costs a handful of read() calls, not one per line.
+_READ_BUFFER = 1 << 20
+# Bytes of a mapped file decoded per step (rounded up to a line boundary).
+_MAP_CHUNK = 1 << 20
+# Lines joined per stdout write; bounds the extra copy the join makes.
+_WRITE_CHUNK = 8192
+
+
+class _MappedLines:
+    """Lines of a regular file, decoded straight out of an mmap.
+
+    Decodes about _MAP_CHUNK bytes at a time, cut after a newline, and splits
+    each slice in one go: no per-line read or decode, and no copy through a
+    TextIOWrapper buffer. Newlines are translated as text-mode open() does.
+    Lines are yielded without their newline (normalize_lines accepts both).
+    """
+
+    def __init__(self, path: str) -> None:
+        self._fh = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except BaseException:
+            self._fh.close()
+            raise
+
+    def __enter__(self) -> "_MappedLines":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._mm.close()
+        self._fh.close()
+
+    def __iter__(self) -> Iterator[str]:
+        # chain() keeps the per-line step in C; the generator runs per slice.
+        return chain.from_iterable(self._slices())
+
+    def _slices(self) -> Iterator[list[str]]:
+        mm = self._mm
+        size = len(mm)
+        start = 0
+        while start < size:
+            cut = mm.find(b"\n", min(start + _MAP_CHUNK, size) - 1)
+            end = size if cut < 0 else cut + 1
+            text = str(mm[start:end], "utf-8")
+            start = end
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
+            lines = text.split("\n")
+            if lines[-1] == "":
+                lines.pop()  # slice ended on a newline
+            yield lines
+
+
 def _read_lines(path: str | None) -> Iterable[str]:
     if path is None or path == "-":
-        return sys.stdin
-    return open(path, "r", encoding="utf-8")
+        try:
+            fd = sys.stdin.fileno()
+        except (AttributeError, OSError, ValueError):
+            # stdin replaced by something without a real fd (e.g. StringIO)
+            return sys.stdin
+        return open(fd, "r", encoding="utf-8", buffering=_READ_BUFFER, closefd=False)
+    try:
+        # Regular files only: pipes/FIFOs can't be mapped, or reopened safely.
+        if stat.S_ISREG(os.stat(path).st_mode):
+            return _MappedLines(path)
+    except (OSError, ValueError):
+        pass  # e.g. empty files can't be mapped; plain open reports real errors
+    return open(path, "r", encoding="utf-8", buffering=_READ_BUFFER)
+
+
+def _write_lines(lines: Iterable[str]) -> None:
+    """Write lines to stdout, newline-terminated, one write per chunk."""
+    it = iter(lines)
+    while True:
+        chunk = list(islice(it, _WRITE_CHUNK))
+        if not chunk:
+            return
+        chunk.append("")
+        sys.stdout.write("\n".join(chunk))
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -31,6 +113,10 @@ def main(argv: list[str] | None = None) -> int:
     p.add_argument("path", nargs="?", default="-", help="Input file path or '-' for stdin")
     p.add_argument("--upper-note", action="store_true", help="Uppercase payload for NOTE records")
     p.add_argument("--strip", action="store_true", help="Strip payload whitespace for all records")
+    p.add_argument(
+        "--workers", type=int, default=1,
+        help="Worker processes for large inputs (default 1: no process pool)",
+    )
     args = p.parse_args(argv)
 
     rules: list[Rule] = []
@@ -41,14 +127,12 @@ def main(argv: list[str] | None = None) -> int:
 
     try:
         with _read_lines(args.path) as fh:  # type: ignore[assignment]
-            out = normalize_lines(fh, rules)
+            # Streamed: chunks already written stay written if a later line fails.
+            _write_lines(normalize_lines(fh, rules, args.workers))
     except Exception as ex:
         # TODO: later: distinguish ParseError vs RuleError
         sys.stderr.write(f"error: {ex}\n")
         return 2
-
-    for line in out:
-        sys.stdout.write(line + "\n")
     return 0
 
 
@@ -1,17 +1,61 @@
-import shutil
+import os
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
 
-def _require(cmd: str) -> None:
-    if shutil.which(cmd) is None:
-        raise RuntimeError(f"Missing required command: {cmd}")
+_REQUIRED = ("python", "git", "docker", "ollama")
+
+def _candidates(cmd: str) -> list[str]:
+    if sys.platform == "win32":
+        exts = os.environ.get("PATHEXT", ".EXE").lower().split(os.pathsep)
+        return [cmd + ext for ext in ("", *exts)]
+    return [cmd]
+
+def _path_commands(names: Iterable[str]) -> dict[str, list[str]]:
+    # One listdir per PATH entry, instead of shutil.which stat-ing every
+    # entry again for every command. Only the wanted names are kept:
+    # name -> directories listing it, in PATH order.
+    wanted = set(names)
+    found: dict[str, list[str]] = {}
+    for d in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        d = d or os.curdir
+        try:
+            listed: Iterable[str] = os.listdir(d)
+        except OSError:
+            continue
+        if sys.platform == "win32":
+            listed = map(str.lower, listed)
+        for name in wanted.intersection(listed):
+            found.setdefault(name, []).append(d)
+    return found
+
+def _is_executable(path: str) -> bool:
+    return os.access(path, os.X_OK) and not os.path.isdir(path)
+
+def _require(cmd: str, available: dict[str, list[str]]) -> None:
+    # Only the few listed hits get stat'ed, to rule out directories and
+    # files without the executable bit.
+    for name in _candidates(cmd):
+        for d in available.get(name, ()):
+            if _is_executable(os.path.join(d, name)):
+                return
+    raise RuntimeError(f"Missing required command: {cmd}")
 
 def run_bootstrap_checks() -> None:
     # Keep it simple: confirm the critical executables exist.
-    _require("python")
-    _require("git")
-    _require("docker")
-    _require("ollama")
+    available = _path_commands(name for cmd in _REQUIRED for name in _candidates(cmd))
+    for cmd in _REQUIRED:
+        _require(cmd, available)
 
-    # Quick sanity checks (fast, no heavy calls)
-    subprocess.run(["docker", "version"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-    subprocess.run(["ollama", "list"], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    # Quick sanity checks (fast, no heavy calls); independent, so run both at once
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        futs = [
+            ex.submit(
+                subprocess.run, cmd, check=True,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            for cmd in (["docker", "version"], ["ollama", "list"])
+        ]
+        for f in futs:
+            f.result()
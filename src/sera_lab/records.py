@@ -6,6 +6,8 @@ A "record" is a single line with a tiny schema:
 Example:
     NOTE|123|hello world
 
+Only the first two '|' are separators; the payload may contain more.
+
 Design notes:
 - Keep this intentionally strict (agents can later relax it).
 - We will later add tests and deliberately inject edge-case bugs.
@@ -17,40 +19,84 @@ TODO ideas for later bugs:
 """
 
 from __future__ import annotations
+import sys
 from dataclasses import dataclass
+from typing import Iterable
 
 from .errors import ParseError
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class Record:
+    """One parsed line. Mutable so rule transforms can update it in place."""
+
     kind: str
     rec_id: str
     payload: str
 
 
-def parse_line(line: str) -> Record:
-    """Parse one input line into a Record.
+def split_line(line: str) -> tuple[str, str, str]:
+    """Split one input line into its (kind, id, payload) fields.
+
+    Same validation as `parse_line`, without building a Record.
 
     Raises:
         ParseError: if the line is malformed.
     """
-    raw = line.rstrip("\n")
+    raw = line[:-1] if line[-1:] == "\n" else line
 
-    # Intentionally naive split: will misbehave if payload contains "|"
-    parts = raw.split("|")
+    # Split on the first two separators only; the payload may contain "|".
+    parts = raw.split("|", 2)
     if len(parts) != 3:
         raise ParseError(f"expected 3 fields separated by '|', got {len(parts)}: {raw!r}")
 
     kind, rec_id, payload = parts
 
-    # Intentionally strict: empty fields are rejected (agents can change later)
-    if not kind or not rec_id or payload is None:
+    # Intentionally strict: empty kind/id are rejected (agents can change later)
+    if not kind or not rec_id:
         raise ParseError(f"empty field in line: {raw!r}")
 
+    # Kinds come from a tiny set: interning shares one object per kind across
+    # parsed Records, and lets compiled rule guards (which intern their kind)
+    # compare by identity. normalize_lines' kernel never builds Records and
+    # does not intern.
+    return sys.intern(kind), rec_id, payload
+
+
+def parse_line(line: str) -> Record:
+    """Parse one input line into a Record.
+
+    Raises:
+        ParseError: if the line is malformed.
+    """
+    kind, rec_id, payload = split_line(line)
     return Record(kind=kind, rec_id=rec_id, payload=payload)
 
 
+def parse_buffer(buf: bytes) -> list[Record]:
+    """Parse a whole buffer of newline-terminated records at once.
+
+    `buf` may be any bytes-like object (bytes, memoryview, mmap). Decoding
+    and line splitting each happen in one bulk C-level pass over the buffer
+    rather than line by line. Lines are split on "\n" only.
+
+    Raises:
+        ParseError: if any line is malformed.
+        UnicodeDecodeError: if the buffer is not valid UTF-8.
+    """
+    lines = str(buf, "utf-8").split("\n")
+    if lines[-1] == "":
+        lines.pop()  # trailing newline, not an empty last record
+    return [parse_line(line) for line in lines]
+
+
 def render_record(r: Record) -> str:
     """Render a Record back to its line form."""
+    # A single f-string builds the result in one allocation; measured faster
+    # than "+" concatenation or "|".join on CPython.
     return f"{r.kind}|{r.rec_id}|{r.payload}"
+
+
+def render_many(records: Iterable[Record]) -> list[str]:
+    """Render many Records at once (no per-record function call)."""
+    return [f"{r.kind}|{r.rec_id}|{r.payload}" for r in records]
@@ -1,6 +1,6 @@
 """Rule definitions.
 
-A rule transforms a Record in some way.
+A rule transforms a Record in some way (in place, returning it).
 
 We keep rules data-driven but intentionally underpowered:
 - only a handful of operations
@@ -9,6 +9,8 @@ We keep rules data-driven but intentionally underpowered:
 """
 
 from __future__ import annotations
+import functools
+import sys
 from dataclasses import dataclass
 from typing import Callable, Iterable, Optional
 
@@ -17,6 +19,7 @@ from .records import Record
 
 
 Transform = Callable[[Record], Record]
+PayloadFn = Callable[[str], str]
 
 
 @dataclass(frozen=True)
@@ -31,6 +34,35 @@ class Rule:
     kind: Optional[str] = None
 
 
+def _prefix(arg: str) -> PayloadFn:
+    # TODO: weird bug later: double-prefixing if already present
+    return lambda p: arg + p
+
+
+def _suffix(arg: str) -> PayloadFn:
+    return lambda p: p + arg
+
+
+# op name -> factory taking the rule's arg and returning the payload op
+_OPS: dict[str, Callable[[str], PayloadFn]] = {
+    "lower_payload": lambda arg: str.lower,
+    "upper_payload": lambda arg: str.upper,
+    "strip_payload": lambda arg: str.strip,
+    "prefix_payload": _prefix,
+    "suffix_payload": _suffix,
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _payload_fn(rule: Rule) -> PayloadFn:
+    """Return the string op a rule applies to the payload (kind is ignored)."""
+    factory = _OPS.get(rule.op.strip())
+    if factory is None:
+        raise RuleError(f"unknown op: {rule.op!r}")
+    return factory(rule.arg)
+
+
+@functools.lru_cache(maxsize=1024)
 def compile_rule(rule: Rule) -> Transform:
     """Compile a Rule into a callable transform.
 
@@ -40,51 +72,107 @@ def compile_rule(rule: Rule) -> Transform:
     - "strip_payload": arg ignored
     - "prefix_payload": arg is prefix text
     - "suffix_payload": arg is suffix text
+
+    Rules are frozen (hashable) and transforms hold no state, so results are
+    memoized per rule.
     """
-    op = rule.op.strip()
+    fn = _payload_fn(rule)
+
+    # Guard decided once here rather than per record; kind and op are bound
+    # as default args so the hot path reads fast locals, not closure cells.
+    # Updates happen in place; the store is skipped when the op handed back
+    # the same string (e.g. strip() with nothing to strip).
+    if rule.kind is None:
+        def xform(r: Record, _fn=fn) -> Record:
+            new = _fn(r.payload)
+            if new is not r.payload:
+                r.payload = new
+            return r
+        return xform
 
-    def _guard(r: Record) -> bool:
-        return rule.kind is None or r.kind == rule.kind
+    # Interned to match parse-time kinds, so the compare is usually identity.
+    def xform(r: Record, _kind=sys.intern(rule.kind), _fn=fn) -> Record:
+        if r.kind != _kind:
+            return r
+        new = _fn(r.payload)
+        if new is not r.payload:
+            r.payload = new
+        return r
+    return xform
 
-    if op == "lower_payload":
-        def xform(r: Record) -> Record:
-            if not _guard(r):
-                return r
-            return Record(r.kind, r.rec_id, r.payload.lower())
-        return xform
 
-    if op == "upper_payload":
-        def xform(r: Record) -> Record:
-            if not _guard(r):
-                return r
-            return Record(r.kind, r.rec_id, r.payload.upper())
-        return xform
+def compile_rules(rules: Iterable[Rule]) -> list[Transform]:
+    """Compile many rules into transforms.
 
-    if op == "strip_payload":
-        def xform(r: Record) -> Record:
-            if not _guard(r):
-                return r
-            return Record(r.kind, r.rec_id, r.payload.strip())
-        return xform
+    Without kind guards the whole chain collapses into a single transform,
+    so there is no per-rule dispatch left when it is applied. Memoized per
+    rule sequence.
+    """
+    return list(_compile_rules(tuple(rules)))
 
-    if op == "prefix_payload":
-        def xform(r: Record) -> Record:
-            if not _guard(r):
-                return r
-            # TODO: weird bug later: double-prefixing if already present
-            return Record(r.kind, r.rec_id, rule.arg + r.payload)
-        return xform
 
-    if op == "suffix_payload":
-        def xform(r: Record) -> Record:
-            if not _guard(r):
-                return r
-            return Record(r.kind, r.rec_id, r.payload + rule.arg)
-        return xform
+@functools.lru_cache(maxsize=256)
+def _compile_rules(rules: tuple[Rule, ...]) -> tuple[Transform, ...]:
+    fused = compile_payload_chain(rules)
+    if fused is None:
+        return tuple(compile_rule(r) for r in rules)
+    if not rules:
+        return ()
 
-    raise RuleError(f"unknown op: {rule.op!r}")
+    def xform(r: Record, _fn=fused) -> Record:
+        new = _fn(r.payload)
+        if new is not r.payload:
+            r.payload = new
+        return r
+    return (xform,)
 
 
-def compile_rules(rules: Iterable[Rule]) -> list[Transform]:
-    """Compile many rules into transforms."""
-    return [compile_rule(r) for r in rules]
+def compile_payload_chain(rules: Iterable[Rule]) -> Optional[PayloadFn]:
+    """Fuse rules into a single payload -> payload function.
+
+    Only possible when no rule is kind-guarded; returns None otherwise so
+    callers can fall back to per-record transforms.
+
+    Raises:
+        RuleError: if any rule has an unknown op.
+    """
+    rules = list(rules)
+    fns = [_payload_fn(r) for r in rules]
+    if any(r.kind is not None for r in rules):
+        return None
+    return _chain(fns)
+
+
+def compile_kind_chain(rules: Iterable[Rule], kind: Optional[str]) -> PayloadFn:
+    """Fuse the rules that apply to records of `kind` into one payload function.
+
+    Kind guards are resolved here, once per kind, instead of per record.
+    `kind=None` gives the chain for any kind no rule names: the unguarded
+    rules only.
+
+    Raises:
+        RuleError: if a matching rule has an unknown op.
+    """
+    return _chain([_payload_fn(r) for r in rules if r.kind is None or r.kind == kind])
+
+
+def _chain(fns: list[PayloadFn]) -> PayloadFn:
+    if not fns:
+        return lambda p: p
+    if len(fns) == 1:
+        return fns[0]
+    # Unroll short chains (the common case) into one nested call.
+    if len(fns) == 2:
+        f1, f2 = fns
+        return lambda p: f2(f1(p))
+    if len(fns) == 3:
+        f1, f2, f3 = fns
+        return lambda p: f3(f2(f1(p)))
+
+    chain = tuple(fns)
+
+    def fused(p: str) -> str:
+        for fn in chain:
+            p = fn(p)
+        return p
+    return fused
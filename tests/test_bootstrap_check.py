@@ -0,0 +1,59 @@
+import os
+import subprocess
+
+import pytest
+
+from sera_lab.core import bootstrap_check
+
+
+def _touch(path, mode=0o755):
+    path.write_text("")
+    path.chmod(mode)
+
+
+@pytest.fixture
+def fake_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("PATH", str(tmp_path))
+    calls = []
+    monkeypatch.setattr(subprocess, "run", lambda cmd, **kw: calls.append(cmd))
+    return tmp_path, calls
+
+
+def test_checks_pass_with_all_commands(fake_path):
+    d, calls = fake_path
+    for cmd in ("python", "git", "docker", "ollama"):
+        _touch(d / cmd)
+    bootstrap_check.run_bootstrap_checks()
+    assert sorted(calls) == [["docker", "version"], ["ollama", "list"]]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="needs POSIX file modes")
+def test_non_executable_file_is_missing(fake_path):
+    d, calls = fake_path
+    for cmd in ("python", "docker", "ollama"):
+        _touch(d / cmd)
+    _touch(d / "git", mode=0o644)
+    with pytest.raises(RuntimeError, match="git"):
+        bootstrap_check.run_bootstrap_checks()
+    assert calls == []
+
+
+def test_directory_is_missing(fake_path):
+    d, calls = fake_path
+    for cmd in ("git", "docker", "ollama"):
+        _touch(d / cmd)
+    (d / "python").mkdir()
+    with pytest.raises(RuntimeError, match="python"):
+        bootstrap_check.run_bootstrap_checks()
+
+
+def test_windows_pathext(fake_path, monkeypatch):
+    d, _ = fake_path
+    monkeypatch.setattr(bootstrap_check.sys, "platform", "win32")
+    monkeypatch.setenv("PATHEXT", os.pathsep.join([".COM", ".EXE"]))
+    # Lower-case on disk: this runs on case-sensitive filesystems too.
+    _touch(d / "git.exe")
+    available = bootstrap_check._path_commands(["git", "git.com", "git.exe", "docker.exe"])
+    bootstrap_check._require("git", available)
+    with pytest.raises(RuntimeError, match="docker"):
+        bootstrap_check._require("docker", available)
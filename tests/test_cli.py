@@ -0,0 +1,24 @@
+from sera_lab import cli
+
+
+def test_read_lines_mapped_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(cli, "_MAP_CHUNK", 8)
+    path = tmp_path / "in.txt"
+    path.write_bytes("A|1|x\r\nB|2|y\rC|3|é\nD|4|last".encode("utf-8"))
+    with cli._read_lines(str(path)) as fh:
+        assert isinstance(fh, cli._MappedLines)
+        assert list(fh) == ["A|1|x", "B|2|y", "C|3|é", "D|4|last"]
+
+
+def test_read_lines_empty_file_falls_back(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    with cli._read_lines(str(path)) as fh:
+        assert list(fh) == []
+
+
+def test_main_file(tmp_path, capsys):
+    path = tmp_path / "in.txt"
+    path.write_text("NOTE|1| a \nTASK|2| b \n", encoding="utf-8")
+    assert cli.main([str(path), "--strip", "--upper-note"]) == 0
+    assert capsys.readouterr().out == "NOTE|1|A\nTASK|2|b\n"
@@ -0,0 +1,100 @@
+import pytest
+
+from sera_lab.errors import ParseError, RuleError
+from sera_lab.normalize import normalize_lines, normalize_lines_list, normalize_record
+from sera_lab.rules import Rule
+
+
+LINES = ["NOTE|1|  Hello \n", "TASK|2| Mixed Case\n", "NOTE|3|x"]
+
+
+def test_normalize_unguarded_rules():
+    rules = [
+        Rule(name="strip", op="strip_payload", arg=""),
+        Rule(name="up", op="upper_payload", arg=""),
+        Rule(name="pre", op="prefix_payload", arg="> "),
+    ]
+    assert list(normalize_lines(LINES, rules)) == [
+        "NOTE|1|> HELLO",
+        "TASK|2|> MIXED CASE",
+        "NOTE|3|> X",
+    ]
+
+
+def test_normalize_guarded_rules():
+    rules = [
+        Rule(name="strip", op="strip_payload", arg=""),
+        Rule(name="upper_note", op="upper_payload", arg="", kind="NOTE"),
+        Rule(name="suf", op="suffix_payload", arg="!", kind="TASK"),
+    ]
+    assert list(normalize_lines(LINES, rules)) == [
+        "NOTE|1|HELLO",
+        "TASK|2|Mixed Case!",
+        "NOTE|3|X",
+    ]
+
+
+def test_normalize_payload_with_separator():
+    rules = [Rule(name="up", op="upper_payload", arg="")]
+    assert list(normalize_lines(["NOTE|1|a|b\n"], rules)) == ["NOTE|1|A|B"]
+
+
+def test_normalize_no_rules_is_identity():
+    assert list(normalize_lines(LINES, [])) == [line.rstrip("\n") for line in LINES]
+
+
+def test_normalize_unknown_op():
+    with pytest.raises(RuleError):
+        list(normalize_lines(LINES, [Rule(name="bad", op="explode", arg="")]))
+
+
+@pytest.mark.parametrize("line", ["NOTE|1", "NOTE\n", "|1|x", "NOTE||x\n"])
+def test_normalize_bad_line(line):
+    with pytest.raises(ParseError):
+        list(normalize_lines(["NOTE|0|ok\n", line], []))
+
+
+def test_normalize_lines_list():
+    out = normalize_lines_list(LINES, [Rule(name="strip", op="strip_payload", arg="")])
+    assert out == ["NOTE|1|Hello", "TASK|2|Mixed Case", "NOTE|3|x"]
+
+
+def test_normalize_parallel_matches_serial(monkeypatch):
+    from sera_lab import normalize
+
+    lines = [f"{'NOTE' if i % 3 else 'TASK'}|{i}| p{i} \n" for i in range(50)]
+    rules = [
+        Rule(name="strip", op="strip_payload", arg=""),
+        Rule(name="upper_note", op="upper_payload", arg="", kind="NOTE"),
+    ]
+    serial = list(normalize_lines(lines, rules))
+
+    monkeypatch.setattr(normalize, "_PARALLEL_MIN_LINES", 10)
+    monkeypatch.setattr(normalize, "_BATCH_SIZE", 7)
+    assert list(normalize_lines(lines, rules)) == serial  # opt-in only
+    assert list(normalize_lines(lines, rules, workers=2)) == serial
+
+
+def test_normalize_record_unchanged_payload_is_kept():
+    from sera_lab.records import parse_line
+    from sera_lab.rules import compile_rules
+
+    rec = parse_line("NOTE|1|clean\n")
+    payload = rec.payload
+    rules = [Rule(name="strip", op="strip_payload", arg="")]
+    assert normalize_record(rec, compile_rules(rules)) is rec
+    assert rec.payload is payload
+
+
+def test_compile_chains_sized_by_rules():
+    from sera_lab.normalize import _compile_chains
+
+    rules = [
+        Rule(name="strip", op="strip_payload", arg=""),
+        Rule(name="upper_note", op="upper_payload", arg="", kind="NOTE"),
+    ]
+    chains, default = _compile_chains(rules)
+    assert set(chains) == {"NOTE"}
+    assert chains["NOTE"](" a ") == "A"
+    assert default(" a ") == "a"
+    assert _compile_chains(rules[:1])[0] == {}
@@ -0,0 +1,48 @@
+import pytest
+
+from sera_lab.errors import ParseError
+from sera_lab.records import Record, parse_buffer, parse_line, render_many, render_record
+
+
+def test_parse_line_roundtrip():
+    r = parse_line("NOTE|123|hello world\n")
+    assert r == Record("NOTE", "123", "hello world")
+    assert render_record(r) == "NOTE|123|hello world"
+
+
+def test_parse_line_empty_payload_allowed():
+    assert parse_line("NOTE|1|") == Record("NOTE", "1", "")
+
+
+def test_parse_line_payload_may_contain_separator():
+    assert parse_line("NOTE|1|a|b\n") == Record("NOTE", "1", "a|b")
+
+
+@pytest.mark.parametrize("line", ["NOTE|123", "NOTE", "NOTE\n", "\n"])
+def test_parse_line_wrong_field_count(line):
+    with pytest.raises(ParseError, match="expected 3 fields"):
+        parse_line(line)
+
+
+@pytest.mark.parametrize("line", ["|1|x", "NOTE||x\n"])
+def test_parse_line_empty_field(line):
+    with pytest.raises(ParseError, match="empty field"):
+        parse_line(line)
+
+
+def test_parse_buffer():
+    buf = "NOTE|1|héllo\nTASK|2|\n".encode("utf-8")
+    assert parse_buffer(buf) == [Record("NOTE", "1", "héllo"), Record("TASK", "2", "")]
+    assert parse_buffer(memoryview(buf[:-1])) == parse_buffer(buf)
+    assert parse_buffer(b"") == []
+
+
+def test_parse_buffer_bad_line():
+    with pytest.raises(ParseError):
+        parse_buffer(b"NOTE|1|ok\nNOTE|2\n")
+
+
+def test_render_many():
+    buf = b"NOTE|1|a|b\nTASK|2|\n"
+    records = parse_buffer(buf)
+    assert render_many(records) == [render_record(r) for r in records] == ["NOTE|1|a|b", "TASK|2|"]
@@ -0,0 +1,78 @@
+import pytest
+
+from sera_lab.errors import RuleError
+from sera_lab.normalize import normalize_record
+from sera_lab.records import Record, parse_line
+from sera_lab.rules import Rule, compile_rule, compile_rules
+
+
+def test_compile_rule_mutates_in_place():
+    rec = Record("NOTE", "1", "Hello")
+    xform = compile_rule(Rule(name="up", op="upper_payload", arg=""))
+    assert xform(rec) is rec
+    assert rec.payload == "HELLO"
+
+
+def test_compile_rule_guard_skips_other_kinds():
+    # Built at runtime so the rule's kind is not the interned literal.
+    kind = "".join(["NO", "TE"])
+    xform = compile_rule(Rule(name="up", op="upper_payload", arg="", kind=kind))
+
+    task = parse_line("TASK|1|abc\n")
+    assert xform(task) is task
+    assert task.payload == "abc"
+
+    note = parse_line("NOTE|2|abc\n")
+    assert xform(note) is note
+    assert note.payload == "ABC"
+
+
+def test_compile_rule_is_memoized():
+    rule = Rule(name="strip", op="strip_payload", arg="")
+    assert compile_rule(rule) is compile_rule(rule)
+    assert compile_rule(rule) is compile_rule(Rule(name="strip", op="strip_payload", arg=""))
+
+
+def test_compile_rules_returns_fresh_list():
+    rules = [Rule(name="strip", op="strip_payload", arg="")]
+    first = compile_rules(rules)
+    second = compile_rules(rules)
+    assert first is not second
+    assert first == second
+    first.clear()
+    assert compile_rules(rules) == second
+
+
+def test_compile_rules_collapses_unguarded_chain():
+    rules = [
+        Rule(name="strip", op="strip_payload", arg=""),
+        Rule(name="up", op="upper_payload", arg=""),
+        Rule(name="pre", op="prefix_payload", arg="<"),
+        Rule(name="suf", op="suffix_payload", arg=">"),
+    ]
+    transforms = compile_rules(rules)
+    assert len(transforms) == 1
+    rec = Record("NOTE", "1", " ab ")
+    assert normalize_record(rec, transforms) is rec
+    assert rec.payload == "<AB>"
+    assert compile_rules([]) == []
+
+
+def test_compile_rules_keeps_guarded_rules_separate():
+    rules = [
+        Rule(name="strip", op="strip_payload", arg=""),
+        Rule(name="up", op="upper_payload", arg="", kind="NOTE"),
+    ]
+    transforms = compile_rules(rules)
+    assert len(transforms) == 2
+    assert normalize_record(Record("NOTE", "1", " a "), transforms).payload == "A"
+    assert normalize_record(Record("TASK", "1", " a "), transforms).payload == "a"
+
+
+def test_unknown_op_raises_every_call():
+    bad = Rule(name="bad", op="explode", arg="")
+    for _ in range(2):
+        with pytest.raises(RuleError, match="unknown op"):
+            compile_rule(bad)
+        with pytest.raises(RuleError, match="unknown op"):
+            compile_rules([bad])